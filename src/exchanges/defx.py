@@ -3,6 +3,8 @@ from uuid import uuid4
 import ccxt.pro as ccxt_pro
 import ccxt.async_support as ccxt_async
 import asyncio
+import aiohttp
+import ssl
 import traceback
 import numpy as np
 import passivbot_rust as pbr
@@ -40,6 +42,22 @@ class DefxBot(Passivbot):
         )
         self.ccp.options["defaultType"] = "swap"
         self.cca.options["defaultType"] = "swap"
+        # one pooled REST session: no connection cap for gather fan-outs, longer
+        # keep-alive and DNS caching so bursts reuse warm connections.
+        # ccxt still owns it and closes it in cca.close()
+        self.cca.ssl_context = (
+            ssl.create_default_context(cafile=self.cca.cafile) if self.cca.verify else False
+        )
+        self.cca.tcp_connector = aiohttp.TCPConnector(
+            ssl=self.cca.ssl_context,
+            limit=0,
+            ttl_dns_cache=300,
+            keepalive_timeout=60,
+            enable_cleanup_closed=True,
+        )
+        self.cca.session = aiohttp.ClientSession(
+            connector=self.cca.tcp_connector, trust_env=self.cca.aiohttp_trust_env
+        )
 
     def set_market_specific_settings(self):
         super().set_market_specific_settings()
@@ -76,8 +94,13 @@ class DefxBot(Passivbot):
                 if self.stop_websocket:
                     break
                 res = await self.ccp.watch_orders()
+                # position side only depends on symbol and side; resolve once per batch
+                pos_sides = {}
                 for order in res:
-                    order["position_side"] = self.determine_pos_side(order)
+                    key = (order["symbol"], order["side"])
+                    if key not in pos_sides:
+                        pos_sides[key] = self.determine_pos_side(order)
+                    order["position_side"] = pos_sides[key]
                     order["qty"] = order["amount"]
                 self.handle_order_update(res)
             except Exception as e:
@@ -85,11 +108,25 @@ class DefxBot(Passivbot):
                 traceback.print_exc()
                 await asyncio.sleep(1)
 
-    def determine_pos_side(self, order):
+    def get_pos_side_mask(self) -> dict:
+        # symbol -> bit flags of open positions: 1=long, 2=short
+        return {
+            symbol: (pos["long"]["size"] != 0.0) | ((pos["short"]["size"] != 0.0) << 1)
+            for symbol, pos in self.positions.items()
+        }
+
+    def determine_pos_side(self, order, pos_mask=None):
         # non hedge mode
-        if self.has_position("long", order["symbol"]):
+        # pass a precomputed get_pos_side_mask() when resolving a large snapshot
+        if pos_mask is None:
+            mask = self.has_position("long", order["symbol"]) | (
+                self.has_position("short", order["symbol"]) << 1
+            )
+        else:
+            mask = pos_mask.get(order["symbol"], 0)
+        if mask & 1:
             return "long"
-        elif self.has_position("short", order["symbol"]):
+        elif mask & 2:
             return "short"
         elif order["side"] == "buy":
             return "long"
@@ -102,8 +139,9 @@ class DefxBot(Passivbot):
         open_orders = []
         try:
             fetched = await self.cca.fetch_open_orders(symbol=symbol)
+            pos_mask = self.get_pos_side_mask()
             for order in fetched:
-                order["position_side"] = self.determine_pos_side(order)
+                order["position_side"] = self.determine_pos_side(order, pos_mask)
                 order["qty"] = order["amount"]
             return sorted(fetched, key=lambda x: x["timestamp"])
         except Exception as e:
@@ -174,15 +212,20 @@ class DefxBot(Passivbot):
     async def fetch_pnls(self, start_time=None, end_time=None, limit=None):
         # TODO: impl start_time and end_time
         res = await self.cca.fetch_my_trades()
-        for i in range(len(res)):
-            res[i]["qty"] = res[i]["amount"]
-            res[i]["pnl"] = float(res[i]["info"]["pnl"])
-            if res[i]["side"] == "buy":
-                res[i]["position_side"] = "long" if res[i]["pnl"] == 0.0 else "short"
-            elif res[i]["side"] == "sell":
-                res[i]["position_side"] = "short" if res[i]["pnl"] == 0.0 else "long"
-            else:
-                raise Exception(f"invalid side {res[i]}")
+        # (side, has pnl) -> position side; only closing fills realize pnl
+        side_pos_side_map = {
+            ("buy", False): "long",
+            ("buy", True): "short",
+            ("sell", False): "short",
+            ("sell", True): "long",
+        }
+        for x in res:
+            x["qty"] = x["amount"]
+            x["pnl"] = float(x["info"]["pnl"])
+            key = (x["side"], x["pnl"] != 0.0)
+            if key not in side_pos_side_map:
+                raise Exception(f"invalid side {x}")
+            x["position_side"] = side_pos_side_map[key]
         return res
 
     async def execute_orders(self, orders: dict) -> dict:
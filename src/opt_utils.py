@@ -1,6 +1,5 @@
 import json
 import logging
-import math
 import msgpack
 from typing import Any
 import passivbot_rust as pbr
@@ -45,22 +44,6 @@ def update_pareto_front(new_index, new_obj, current_front, objectives_dict, high
     return new_front
 
 
-def calc_dist(p0, p1):
-    return math.sqrt(sum((a - b) ** 2 for a, b in zip(p0, p1)))
-
-
-def calc_normalized_dist(point, ideal, w0_min, w0_max, w1_min, w1_max):
-    norm_point = [
-        (p - min_v) / (max_v - min_v) if max_v > min_v else p
-        for p, min_v, max_v in zip(point, mins, maxs)
-    ]
-    norm_ideal = [
-        (i - min_v) / (max_v - min_v) if max_v > min_v else i
-        for i, min_v, max_v in zip(ideal, mins, maxs)
-    ]
-    return math.sqrt(sum((p - i) ** 2 for p, i in zip(norm_point, norm_ideal)))
-
-
 def format_distance(dist: float) -> str:
     """Format distance to fixed-width string for lexicographical sorting."""
     return f"{dist:08.4f}"
@@ -156,8 +156,9 @@ def results_writer_process(
         logging.error(f"Results writer process error: {e}")
     finally:
         # ------------------------------------------------------------------
-        # Make *absolutely* sure the Pareto directory has fresh distance
-        # prefixes before we quit (even after Ctrl-C or an uncaught error).
+        # Make *absolutely* sure the Pareto directory and its _closest.json
+        # pointer are up to date before we quit (even after Ctrl-C or an
+        # uncaught error).
         # ------------------------------------------------------------------
         try:
             store.flush_interval = 0.0
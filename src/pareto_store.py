@@ -1,17 +1,69 @@
 from __future__ import annotations
 import os
 import json
+import shutil
 import hashlib
 from typing import Dict
 import glob
 import math
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 import numpy as np
 import threading
 import logging
+import operator
+import re
 import passivbot_rust as pbr
-from opt_utils import calc_normalized_dist, round_floats, dominates
-from pure_funcs import calc_hash
+from opt_utils import round_floats
+import orjson
+
+
+def _tag_non_finite(obj):
+    """
+    orjson writes inf, -inf and nan as null, so before hashing they are
+    replaced by the stdlib encoder's tokens as strings to keep them apart
+    from each other and from None.  A string equal to one of those tokens
+    would still collide, which no entry contains in practice.
+    """
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else json.dumps(obj)
+    if isinstance(obj, dict):
+        return {k: _tag_non_finite(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_tag_non_finite(v) for v in obj]
+    return obj
+
+
+def _dumps(obj) -> bytes:
+    """Compact serialisation with sorted keys, used for hashing."""
+    return orjson.dumps(_tag_non_finite(obj), option=orjson.OPT_SORT_KEYS)
+
+
+def _dump_member(entry: dict) -> bytes:
+    """
+    On-disk format of a member file.  Stays on the stdlib encoder: orjson
+    writes inf/nan as null, and per-exchange analyses can contain inf.
+    """
+    return json.dumps(entry, separators=(",", ":"), indent=4).encode("utf-8")
+
+
+def _loads(data: bytes):
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        # Infinity/NaN literals written by the stdlib encoder
+        return json.loads(data)
+
+
+def hash_entry(entry: dict) -> str:
+    """
+    Content fingerprint of a (rounded) entry, used as its key in the store.
+    Only needs to dedupe, not resist attacks: 64-bit BLAKE2b -> 16 hex chars.
+    """
+    return hashlib.blake2b(_dumps(entry), digest_size=8).hexdigest()
+
+
+CLOSEST_FILENAME = "_closest.json"  # points at the member closest to the ideal point
 
 
 class ParetoStore:
@@ -32,11 +84,18 @@ class ParetoStore:
         self._entries: dict[str, dict] = {}  # hash -> full entry
         self._objectives: dict[str, tuple] = {}  # hash -> objective vector
         self._front: list[str] = []  # list of hashes (Pareto set)
+        self._front_matrix: np.ndarray | None = None  # row i = objectives of _front[i]
         self._objective_lookup: dict[tuple, str] = {}  # objective vector ➜ hash
+        # file bookkeeping: filled by bootstrap, then only touched by the IO thread
+        self._hash_to_filename: dict[str, str] = {}  # hash -> file name currently on disk
+        self._stale_files: set[str] = set()  # unreadable/duplicate files found at bootstrap
         # ------------------------------------------------------------------
+        self._dirty = False  # front changed since the last disk write
         self.n_iters = 0
         self._last_flush_ts = time.time()
         self._lock = threading.RLock()
+        # single worker: flushes never overlap and are applied in order
+        self._io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pareto-io")
 
         self.scoring_keys = None
 
@@ -48,127 +107,235 @@ class ParetoStore:
         Add a new entry, update Pareto front in‑memory.
         Return True if the store actually changed.
         """
-        self.n_iters += 1
-        if self.scoring_keys is None:
-            self.scoring_keys = entry["optimize"]["scoring"]
-        rounded = round_floats(entry, self.sig_digits)
-        h = calc_hash(rounded)
         with self._lock:
-            if h in self._entries:  # fast‑dedupe
-                return False
-
-            # objective vector = sorted w_i keys
-            w_keys = sorted(k for k in rounded["analyses_combined"] if k.startswith("w_"))
-            obj = tuple(rounded["analyses_combined"][k] for k in w_keys)
-
-            # ───────────── NEW: dedupe on the objective vector ──────────────
-            # identical after rounding  → nothing new to store or write
-            if obj in self._objective_lookup:
-                self._log.info(f"Dropping candidate whose obj score is already present: {obj}")
+            if not self._insert(entry):
                 return False
-            # ────────────────────────────────────────────────────────────────
-
-            # discard if dominated by current front
-            if any(dominates(self._objectives[idx], obj) for idx in self._front):
-                return False
-
-            # remove dominated members
-            dominated = [idx for idx in self._front if dominates(obj, self._objectives[idx])]
-            for idx in dominated:
-                del self._objective_lookup[self._objectives[idx]]
-                self._front.remove(idx)
-
-            # add new member
-            self._entries[h] = rounded
-            self._objectives[h] = obj
-            self._front.append(h)
-            self._objective_lookup[obj] = h
-
-            self._log_front_state(
-                added=1,
-                removed=len(dominated),
-            )
-
             # maybe flush
             self._maybe_flush()
-
             return True
 
+    def _insert(self, entry: dict) -> bool:
+        self.n_iters += 1
+        if self.scoring_keys is None:
+            self.scoring_keys = entry["optimize"]["scoring"]
+        rounded = round_floats(entry, self.sig_digits)
+        h = hash_entry(rounded)
+        if h in self._entries:  # fast‑dedupe
+            return False
+
+        # objective vector = sorted w_i keys
+        w_keys = sorted(k for k in rounded["analyses_combined"] if k.startswith("w_"))
+        obj = tuple(rounded["analyses_combined"][k] for k in w_keys)
+
+        # ───────────── NEW: dedupe on the objective vector ──────────────
+        # identical after rounding  → nothing new to store or write
+        if obj in self._objective_lookup:
+            self._log.info(f"Dropping candidate whose obj score is already present: {obj}")
+            return False
+        # ────────────────────────────────────────────────────────────────
+
+        point = np.array(obj, dtype=float)
+        front = self._front_matrix
+        if front is None:
+            front = np.empty((0, len(point)))
+
+        # discard if dominated by current front; "not worse anywhere" is
+        # ~any(>) rather than all(<=) so NaN counts as a tie, as in opt_utils.dominates
+        if np.any(~np.any(front > point, axis=1) & np.any(front < point, axis=1)):
+            return False
+
+        # remove dominated members
+        dominated_mask = ~np.any(point > front, axis=1) & np.any(point < front, axis=1)
+        dominated = [self._front[i] for i in np.flatnonzero(dominated_mask)]
+        for idx in dominated:
+            del self._objective_lookup[self._objectives[idx]]
+        if dominated:
+            self._front = [idx for idx, d in zip(self._front, dominated_mask) if not d]
+            front = front[~dominated_mask]
+
+        # add new member
+        self._entries[h] = rounded
+        self._objectives[h] = obj
+        self._front.append(h)
+        self._front_matrix = np.vstack((front, point))
+        self._objective_lookup[obj] = h
+        self._dirty = True
+
+        self._log_front_state(
+            added=1,
+            removed=len(dominated),
+        )
+        return True
+
     def get_front(self) -> list[dict]:
         with self._lock:
             return [self._entries[h] for h in self._front]
 
+    def list_sorted(self) -> list[tuple[float, str]]:
+        """Front members as ``(distance, hash)`` pairs, closest to the ideal point first."""
+        with self._lock:
+            if not self._front:
+                return []
+            return sorted(zip(self._distances().tolist(), self._front))
+
     def flush_now(self) -> None:
-        """Force a write of the current in‑memory set to disk."""
+        """Force a write of the current in‑memory set to disk and wait for it."""
         with self._lock:
-            self._write_all_to_disk()
+            pending = self._write_all_to_disk()
             self._last_flush_ts = time.time()
+        pending.result()
 
     def _maybe_flush(self) -> None:
         if time.time() - self._last_flush_ts >= self.flush_interval:
-            self._write_all_to_disk()
+            self._write_all_to_disk().add_done_callback(self._log_flush_error)
             self._last_flush_ts = time.time()
 
-    def _write_all_to_disk(self) -> None:
+    def _log_flush_error(self, future: Future) -> None:
+        e = future.exception()
+        if e is not None:
+            self._log.error("Pareto flush failed, will retry on the next flush: %s", e)
+
+    def _distances(self) -> np.ndarray:
+        """Normalised distance of every front member to the per‑objective minimum."""
+        obj_matrix = self._front_matrix
+        mins, maxs = obj_matrix.min(axis=0), obj_matrix.max(axis=0)
+        spread = maxs > mins
+        norm = np.where(spread, (obj_matrix - mins) / np.where(spread, maxs - mins, 1.0), 0.0)
+        return np.sqrt(np.einsum("ij,ij->i", norm, norm))
+
+    def _write_all_to_disk(self) -> Future:
         """
         Flush the current Pareto front to disk.
 
-        * For every hash in ``self._front`` an up‑to‑date
-          ``"<dist>_<hash>.json"`` file is created if it does not already exist.
-        * After writing, every ``*.json`` file whose hash is **not** in
-          the front is removed.  The directory therefore mirrors the
-          in‑memory set 1‑to‑1.
+        * For every hash in ``self._front`` a ``"<hash>.json"`` file is created
+          if it does not already exist.  Members loaded from a file with any
+          other name (e.g. ``"<dist>_<hash>.json"`` written by older versions)
+          are rewritten under the new name and the old file is purged.
+        * After writing, every file whose hash is **not** in the front is
+          removed.  The directory therefore mirrors the in‑memory set 1‑to‑1.
+        * ``_closest.json`` is atomically re‑pointed at the member closest to
+          the ideal point; use ``list_sorted()`` for the full ranking.
+
+        The work runs on the store's single IO thread, so callers aren't
+        blocked on disk and flushes are applied in order.  Returns the future
+        of that work.  Nothing is touched if the front has not changed since
+        the last write.
         """
-        if not self._front:
-            return
-
-        # ── distance normalisation ------------------------------------------------
-        obj_matrix = [self._objectives[h] for h in self._front]
-        mins = [min(col) for col in zip(*obj_matrix)]
-        maxs = [max(col) for col in zip(*obj_matrix)]
-
-        live_files: set[str] = set()
-
-        for h in self._front:
-            obj = self._objectives[h]
-            norm = [(v - mi) / (ma - mi) if ma > mi else 0.0 for v, mi, ma in zip(obj, mins, maxs)]
-            dist = math.sqrt(sum(v * v for v in norm))
-            path = os.path.join(self.pareto_dir, f"{dist:08.4f}_{h}.json")
-            live_files.add(path)
+        return self._io_executor.submit(self._sync_to_disk)
 
-            if not os.path.exists(path):
+    def _sync_to_disk(self) -> None:
+        """
+        Runs on the IO thread.  Only the front is read under the lock; the file
+        bookkeeping (``_hash_to_filename``, ``_stale_files``) is owned by this
+        thread once bootstrap is done and is updated only after each file
+        operation succeeded.  On failure the store is marked dirty again so the
+        next flush retries.
+        """
+        with self._lock:
+            if not self._front or not self._dirty:
+                return
+            front = list(self._front)
+            entries = [self._entries[h] for h in front]
+            closest = f"{front[int(np.argmin(self._distances()))]}.json"
+            self._dirty = False
+        try:
+            for h, entry in zip(front, entries):
+                filename = f"{h}.json"
+                prev = self._hash_to_filename.get(h)
+                if prev == filename:
+                    continue
+                path = os.path.join(self.pareto_dir, filename)
                 tmp = path + ".tmp"
-                with open(tmp, "w") as f:
-                    json.dump(self._entries[h], f, separators=(",", ":"), indent=4)
-                os.replace(tmp, path)
-
-        # ── one‑pass purge of everything that is *not* in the front --------------
-        for fp in glob.glob(os.path.join(self.pareto_dir, "*.json")):
-            if fp not in live_files:
                 try:
-                    os.remove(fp)
-                except OSError as e:
-                    self._log.warning("Could not remove obsolete Pareto file %s: %s", fp, e)
+                    with open(tmp, "wb") as f:
+                        f.write(_dump_member(entry))
+                    os.replace(tmp, path)
+                except OSError:
+                    if os.path.exists(tmp):
+                        os.remove(tmp)
+                    raise
+                if prev is not None:
+                    self._stale_files.add(prev)  # old name of the same member, purged below
+                self._hash_to_filename[h] = filename
+
+            # ── purge files of everything that is *not* in the front ----------------
+            # a stale duplicate may share its name with the member's file
+            live_files = {self._hash_to_filename[h] for h in front}
+            obsolete = [
+                (h, self._hash_to_filename[h]) for h in set(self._hash_to_filename) - set(front)
+            ]
+            obsolete += [(None, filename) for filename in self._stale_files]
+            for h, filename in obsolete:
+                if filename not in live_files:
+                    fp = os.path.join(self.pareto_dir, filename)
+                    try:
+                        os.remove(fp)
+                    except FileNotFoundError:
+                        pass
+                    except OSError as e:
+                        # stays tracked, so the next flush tries again
+                        self._log.warning("Could not remove obsolete Pareto file %s: %s", fp, e)
+                        continue
+                if h is None:
+                    self._stale_files.discard(filename)
+                else:
+                    del self._hash_to_filename[h]
+
+            link = os.path.join(self.pareto_dir, CLOSEST_FILENAME)
+            tmp = link + ".tmp"
+            if os.path.lexists(tmp):
+                os.remove(tmp)
+            try:
+                os.symlink(closest, tmp)
+            except OSError:
+                # no symlink support (e.g. unprivileged Windows): keep a copy instead
+                shutil.copyfile(os.path.join(self.pareto_dir, closest), tmp)
+            os.replace(tmp, link)
+        except BaseException:
+            with self._lock:
+                self._dirty = True
+            raise
 
     def _bootstrap_from_disk(self) -> None:
         """
         Read existing *.json files once at start so we don’t lose old results
-        when the new optimizer run appends.
+        when the new optimizer run appends.  No flush happens until every file
+        has been read.
+
+        This single directory scan also seeds ``self._hash_to_filename``; from
+        then on the store knows every file it owns and never rescans.  Files
+        whose hash does not end up in the front are removed by the next flush,
+        as are unreadable files and extra copies of a hash (``self._stale_files``).
         """
-        for fp in glob.glob(os.path.join(self.pareto_dir, "*.json")):
-            try:
-                with open(fp) as f:
-                    entry = json.load(f)
-                self.add_entry(entry)  # uses the normal path
-            except Exception as e:
-                print(f"bootstrap skip {fp}: {e}")
+        with self._lock:
+            with os.scandir(self.pareto_dir) as it:
+                paths = [
+                    e.path
+                    for e in it
+                    if e.name.endswith(".json") and e.name != CLOSEST_FILENAME and e.is_file()
+                ]
+            for fp in paths:
+                filename = os.path.basename(fp)
+                h = os.path.splitext(filename)[0].split("_")[-1]
+                try:
+                    with open(fp, "rb") as f:
+                        entry = _loads(f.read())
+                    self._insert(entry)
+                except Exception as e:
+                    print(f"bootstrap skip {fp}: {e}")
+                    self._stale_files.add(filename)
+                    continue
+                if h in self._hash_to_filename:
+                    self._stale_files.add(filename)  # second copy of the same member
+                else:
+                    self._hash_to_filename[h] = filename
 
     def _log_front_state(self, *, added: int, removed: int) -> None:
         """Emit a compact one‑liner with min / max / spread per objective."""
-        objs = [self._objectives[idx] for idx in self._front]
+        objs = self._front_matrix
 
-        mins = [min(col) for col in zip(*objs)]
-        maxs = [max(col) for col in zip(*objs)]
+        mins = objs.min(axis=0).tolist()
+        maxs = objs.max(axis=0).tolist()
 
         metrics = []
         for i, key in enumerate(self.scoring_keys):
@@ -207,12 +374,20 @@ def compute_ideal(values_matrix, mode="min", weights=None, eps=1e-3, pct=10):
 
     if mode in ["g", "geomedian"]:
         # one Weiszfeld step is already a good approximation
+        values_matrix = np.asarray(values_matrix, dtype=float)
         z = values_matrix.mean(axis=0)
+        # reuse buffers across iterations; weighted sum is a single gemv
+        diff = np.empty_like(values_matrix)
+        d = np.empty(len(values_matrix))
+        w = np.empty(len(values_matrix))
         for _ in range(10):
-            d = np.linalg.norm(values_matrix - z, axis=1)
-            w = np.where(d > 0, 1.0 / d, 0.0)
-            z_new = (values_matrix * w[:, None]).sum(axis=0) / w.sum()
-            if np.allclose(z, z_new, atol=1e-9):
+            np.subtract(values_matrix, z, out=diff)
+            np.einsum("ij,ij->i", diff, diff, out=d)
+            np.sqrt(d, out=d)
+            w.fill(0.0)
+            np.reciprocal(d, where=d > 0, out=w)
+            z_new = (w @ values_matrix) / w.sum()
+            if np.max(np.abs(z - z_new)) < 1e-9:
                 break
             z = z_new
         return z
@@ -220,6 +395,34 @@ def compute_ideal(values_matrix, mode="min", weights=None, eps=1e-3, pct=10):
     raise ValueError(f"unknown mode {mode}")
 
 
+def _read_json(path: str):
+    """Return ``(path, parsed)``; on failure the exception takes the place of ``parsed``."""
+    try:
+        with open(path, "rb") as f:
+            return path, _loads(f.read())
+    except Exception as e:
+        return path, e
+
+
+OPERATORS = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "==": operator.eq,
+    "=": operator.eq,
+}
+LIMIT_EXPR_RE = re.compile(r"^(.+?)(<=|>=|==|<|>|=)(.+)$")
+
+
+def parse_limit_expr(expr: str):
+    match = LIMIT_EXPR_RE.match(expr)
+    if match is None:
+        raise ValueError(f"Invalid limit expression: {expr}")
+    key, op_str, val = match.groups()
+    return key.strip(), OPERATORS[op_str], float(val.strip())
+
+
 def comma_separated_values_float(x):
     return [float(z) for z in x.split(",")]
 
@@ -233,6 +436,12 @@ def main():
     parser = argparse.ArgumentParser(description="Analyze and plot Pareto front")
     parser.add_argument("pareto_dir", type=str, help="Path to pareto/ directory")
     parser.add_argument("--json", action="store_true", help="Output summary as JSON")
+    parser.add_argument(
+        "--list-sorted",
+        action="store_true",
+        dest="list_sorted",
+        help="List all members sorted by distance to the ideal point",
+    )
     parser.add_argument(
         "-w",
         "--weights",
@@ -264,7 +473,11 @@ def main():
     pareto_dir = args.pareto_dir.rstrip("/")
     if not pareto_dir.endswith("pareto"):
         pareto_dir += "/pareto"
-    entries = sorted(glob.glob(os.path.join(pareto_dir, "*.json")))
+    entries = sorted(
+        fp
+        for fp in glob.glob(os.path.join(pareto_dir, "*.json"))
+        if os.path.basename(fp) != CLOSEST_FILENAME
+    )
     print(f"Found {len(entries)} Pareto members.")
 
     points = []
@@ -272,26 +485,6 @@ def main():
     w_keys = []
     metric_names, metric_name_map = None, None
 
-    import operator
-    import re
-
-    OPERATORS = {
-        "<": operator.lt,
-        "<=": operator.le,
-        ">": operator.gt,
-        ">=": operator.ge,
-        "==": operator.eq,
-        "=": operator.eq,
-    }
-
-    def parse_limit_expr(expr: str):
-        for op_str in ["<=", ">=", "<", ">", "==", "="]:
-            if op_str in expr:
-                key, val = expr.split(op_str)
-                key, val = key.strip(), float(val.strip())
-                return key, OPERATORS[op_str], val
-        raise ValueError(f"Invalid limit expression: {expr}")
-
     limit_checks = []
     if args.limits:
         for expr in args.limits:
@@ -301,27 +494,39 @@ def main():
             except Exception as e:
                 print(f"Skipping invalid limit expression '{expr}': {e}")
 
-    for entry_path in entries:
+    limit_values = []  # row per point: its values for the limit_checks keys
+
+    # file reads dominate on large fronts; overlap them in a thread pool
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        loaded = list(executor.map(_read_json, entries))
+
+    for entry_path, entry in loaded:
+        if isinstance(entry, Exception):
+            print(f"Error loading {entry_path}: {entry}")
+            continue
         try:
-            with open(entry_path) as f:
-                entry = json.load(f)
             h = os.path.splitext(os.path.basename(entry_path))[0].split("_")[-1]
             if not w_keys:
                 w_keys = sorted(k for k in entry.get("analyses_combined", {}) if k.startswith("w_"))
             if metric_names is None:
                 metric_names = entry.get("optimize", {}).get("scoring", [])
                 metric_name_map = {f"w_{i}": name for i, name in enumerate(metric_names)}
-            if any(
-                not op(entry.get("analyses_combined", {}).get(key, float("inf")), val)
-                for key, op, val in limit_checks
-            ):
-                continue
-            values = [entry.get("analyses_combined", {}).get(k) for k in w_keys]
+            analyses = entry.get("analyses_combined", {})
+            values = [analyses.get(k) for k in w_keys]
             if all(v is not None for v in values):
+                limit_values.append([analyses.get(key, np.inf) for key, _, _ in limit_checks])
                 points.append((*values, h))
                 filenames[h] = os.path.split(entry_path)[-1]
         except Exception as e:
-            print(f"Error loading {h}: {e}")
+            print(f"Error loading {entry_path}: {e}")
+
+    if points and limit_checks:
+        # one vectorised comparison per limit instead of per-entry checks
+        limit_matrix = np.array(limit_values, dtype=float)
+        mask = np.ones(len(points), dtype=bool)
+        for col, (_, op_fn, val) in zip(limit_matrix.T, limit_checks):
+            mask &= op_fn(col, val)
+        points = [p for p, keep in zip(points, mask) if keep]
 
     if not points:
         print("No valid Pareto points found.")
@@ -341,21 +546,13 @@ def main():
     mins = np.min(values_matrix, axis=0)
     maxs = np.max(values_matrix, axis=0)
 
-    norm_matrix = np.array(
-        [
-            [
-                (v - mins[i]) / (maxs[i] - mins[i]) if maxs[i] > mins[i] else v
-                for i, v in enumerate(row)
-            ]
-            for row in values_matrix
-        ]
-    )
-    ideal_norm = [
-        (ideal[i] - mins[i]) / (maxs[i] - mins[i]) if maxs[i] > mins[i] else ideal[i]
-        for i in range(len(ideal))
-    ]
+    spread = maxs > mins
+    range_ = np.where(spread, maxs - mins, 1.0)
+    norm_matrix = np.where(spread, (values_matrix - mins) / range_, values_matrix)
+    ideal_norm = np.where(spread, (ideal - mins) / range_, ideal)
 
-    dists = np.linalg.norm(norm_matrix - ideal_norm, axis=1)
+    diff = norm_matrix - ideal_norm
+    dists = np.sqrt(np.einsum("ij,ij->i", diff, diff))
     closest_idx = int(np.argmin(dists))
 
     print(f"Ideal point ({args.mode}{' ' + str(weights) if args.mode == 'weighted' else ''})")
@@ -371,6 +568,11 @@ def main():
             f"  {key} ({metric_name_map[key]}) {' ' * paddings[key]} = {values_matrix[closest_idx][i]:.5f}"
         )
 
+    if args.list_sorted:
+        print("\nMembers sorted by distance to ideal:")
+        for i in np.argsort(dists):
+            print(f"  {dists[i]:.5f} {pareto_dir}/{filenames[hashes[i]]}")
+
     if args.json:
         summary = {
             "n_members": len(hashes),
@@ -474,14 +676,17 @@ def main():
         # More efficient implementation for high-dimensional Pareto fronts
         # Focus only on essential visualizations and optimize performance
         import pandas as pd
+        from matplotlib.collections import LineCollection
 
         # Convert data to pandas DataFrame for easier handling
         df = pd.DataFrame(values_matrix, columns=w_keys)
         df["hash"] = hashes
         df["dist_from_ideal"] = dists
 
-        # Sort by distance from ideal
-        df_sorted = df.sort_values("dist_from_ideal")
+        # Only the nearest solutions are reported; partition instead of a full sort
+        n_top = min(200, len(dists))
+        top_indices = np.argpartition(dists, n_top - 1)[:n_top]
+        top_indices = top_indices[np.argsort(dists[top_indices])]
 
         # Create a streamlined figure with just two key plots
         fig, axes = plt.subplots(1, 2, figsize=(14, 6))
@@ -489,15 +694,13 @@ def main():
         # 1. Parallel Coordinates - more efficient implementation
         ax = axes[0]
 
-        # Only show up to the top 100 solutions to avoid clutter and improve performance
-        top_indices = df_sorted.index[:200]
-
-        # Plot in one batch for better performance
-        for i in top_indices:
-            if i == closest_idx:
-                ax.plot(range(len(w_keys)), norm_matrix[i], "r-", linewidth=2.5, alpha=0.9, zorder=5)
-            else:
-                ax.plot(range(len(w_keys)), norm_matrix[i], "b-", linewidth=1, alpha=0.3)
+        # Only show up to the top 200 solutions to avoid clutter and improve performance
+        # Plot in one batch (a single LineCollection) for better performance
+        xs = np.arange(len(w_keys))
+        others = norm_matrix[top_indices[top_indices != closest_idx]]
+        segments = np.stack(np.broadcast_arrays(xs, others), axis=-1)
+        ax.add_collection(LineCollection(segments, colors="b", linewidths=1, alpha=0.3))
+        ax.plot(xs, norm_matrix[closest_idx], "r-", linewidth=2.5, alpha=0.9, zorder=5)
 
         # Plot ideal point
         ax.plot(range(len(w_keys)), ideal_norm, "go--", linewidth=2, markersize=8)
@@ -512,22 +715,9 @@ def main():
         # 2. Create a heatmap instead of a radar chart (more compatible)
         ax = axes[1]
 
-        # Create correlation matrix
-        corr_matrix = np.zeros((len(w_keys), len(w_keys)))
-        for i, key1 in enumerate(w_keys):
-            for j, key2 in enumerate(w_keys):
-                vals1 = values_matrix[:, i]
-                vals2 = values_matrix[:, j]
-
-                # Calculate correlation
-                mean1, mean2 = np.mean(vals1), np.mean(vals2)
-                num = np.sum((vals1 - mean1) * (vals2 - mean2))
-                den = np.sqrt(np.sum((vals1 - mean1) ** 2) * np.sum((vals2 - mean2) ** 2))
-
-                if den != 0:
-                    corr_matrix[i, j] = num / den
-                else:
-                    corr_matrix[i, j] = 0
+        # Create correlation matrix (constant objectives correlate as 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corr_matrix = np.nan_to_num(np.corrcoef(values_matrix, rowvar=False))
 
         # Create heatmap
         im = ax.imshow(corr_matrix, cmap="coolwarm", vmin=-1, vmax=1)
@@ -566,7 +756,7 @@ def main():
         print(header)
         print("-" * 80)
 
-        for rank, (idx, row) in enumerate(df_sorted.head(5).iterrows(), 1):
+        for rank, (idx, row) in enumerate(df.loc[top_indices[:5]].iterrows(), 1):
             values_str = " ".join([f"{row[k]:<10.4f}" for k in w_keys])
             print(f"{rank:<5} {row['hash']:<16} {row['dist_from_ideal']:<10.4f} {values_str}")
 
@@ -593,13 +783,8 @@ def main():
             print("No strong correlations found between objectives.")
 
         # Calculate diversity of solutions
-        diversity_scores = []
-        for i in range(len(w_keys)):
-            col_values = values_matrix[:, i]
-            min_val = min(col_values)
-            max_val = max(col_values)
-            diversity = max_val - min_val
-            diversity_scores.append((w_keys[i], diversity))
+        diversity = values_matrix.max(axis=0) - values_matrix.min(axis=0)
+        diversity_scores = list(zip(w_keys, diversity.tolist()))
 
         diversity_scores.sort(key=lambda x: x[1], reverse=True)
         print("\nObjective diversity (range of values):")